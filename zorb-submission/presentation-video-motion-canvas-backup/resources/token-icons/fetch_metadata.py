@@ -8,6 +8,9 @@ import hashlib
 
 METAPLEX_PROGRAM = "metaqbxxUerdq28cj1RbAWkYQm3ybzjb6a8bt518x1s"
 
+# Shared session so every DAS lookup reuses the same pooled TLS connection
+session = requests.Session()
+
 def find_metadata_pda(mint: str) -> str:
     """Derive Metaplex metadata PDA for a mint"""
     from hashlib import sha256
@@ -33,11 +36,11 @@ def find_metadata_pda(mint: str) -> str:
     # Actually let's just use the Metaplex SDK approach via API
     return None
 
-def fetch_metadata_via_das(mint: str):
+def fetch_metadata_via_das(mint: str, http: requests.Session = session):
     """Fetch metadata using DAS API"""
     # Try Helius DAS API (public endpoint)
     try:
-        resp = requests.post(
+        resp = http.post(
             "https://mainnet.helius-rpc.com/?api-key=15319bf4-5b40-4958-ac8d-6313aa55eb92",
             json={
                 "jsonrpc": "2.0",